@@ -0,0 +1,31 @@
+# extraction_cache.py
+import os
+import threading
+
+# Folder where the extracted data of each document is stored
+CACHE_DIR = os.path.join('output', '.cache')
+
+def _cache_file(key):
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+# Function to read an entry from the cache
+def get(key):
+    """Return the raw JSON bytes stored under the key, or None if there is no entry.
+    The entry isn't parsed here, so callers can parse and validate it in a single pass."""
+    try:
+        with open(_cache_file(key), 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+# Function to write an entry to the cache
+def put(key, data):
+    """Store the raw JSON (str or bytes) under the key, replacing any previous entry"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_file = _cache_file(key)
+    
+    # Write to a temporary file first so concurrent readers never see a partial entry
+    temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data.encode('utf-8') if isinstance(data, str) else data)
+    os.replace(temp_file, cache_file)
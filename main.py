@@ -1,131 +1,371 @@
 import os
-import glob
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from pydantic import BaseModel, Field, field_validator
-from enum import Enum
-from typing import Optional, List
-import streamlit as st
+from pydantic import ValidationError
 from docx import Document
+from docx.table import Table
 import time
-import json
-from llama_cloud_services import LlamaExtract, EU_BASE_URL
+import orjson
+import hashlib
+import logging
+import sys
+import asyncio
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from llama_cloud.core.api_error import ApiError
+from llama_cloud_services import LlamaExtract, SourceText, EU_BASE_URL
+import extraction_cache
+from models_lite import CompanyInfoLite
 
-# Read the LlamaCloud API key from Streamlit secrets
-LLAMA_CLOUD_API_KEY = st.secrets["LLAMA_CLOUD_API_KEY_EU"]
+# Progress is reported through logging, one record per message or document summary
+logger = logging.getLogger(__name__)
+
+# Read the LlamaCloud API key from the environment, or from Streamlit secrets if it isn't set
+LLAMA_CLOUD_API_KEY = os.environ.get("LLAMA_CLOUD_API_KEY_EU")
+if not LLAMA_CLOUD_API_KEY:
+    # Streamlit is slow to import, so it's only loaded when the key has to come from its secrets
+    import streamlit as st
+    LLAMA_CLOUD_API_KEY = st.secrets["LLAMA_CLOUD_API_KEY_EU"]
 
 #### Set up the LlamaExtract client
 llama_extract = LlamaExtract(api_key=LLAMA_CLOUD_API_KEY, base_url=EU_BASE_URL) 
 
+# Name of the LlamaExtract agent used for the extraction
+EXTRACTION_AGENT_NAME = "company-info-extractor"
+
+# Limit the number of documents being uploaded and queued at once to stay under the service rate limit
+MAX_CONCURRENT_EXTRACTIONS = 4
+
+# HTTP status codes of LlamaExtract failures that are worth retrying
+TRANSIENT_STATUS_CODES = (408, 425, 429, 500, 502, 503, 504)
+
+# Folder where the raw data of extractions that failed validation is kept for inspection
+ERRORS_DIR = os.path.join('output', 'errors')
+
 
 # Import models
 from models import (
-    ConsultationType,
-    MaturityLevel,
-    CompanyType,  
-    Services,  
-    Domain, 
-    TargetGroup, 
-    AIField, 
-    CompanyDomain, 
-    CompanyTargetGroup, 
-    CompanyAIField, 
-    ServicesDescriptions,
     CompanyInfo,
-    DataType,
-    DataRequirements
+    COMPANY_INFO_ADAPTER,
+    company_info_schema
 )
 
+# Fallback for documents that couldn't be extracted. It is built without validation, since "n/a" isn't
+# one of the allowed values of the Literal fields; the report code shows these placeholders as they are.
+DEFAULT_COMPANY_INFO = CompanyInfo.model_construct(
+    company_name="n/a",
+    country="n/a",
+    consultation_date="n/a",
+    experts=("Unknown",),
+    consultation_type="n/a",
+    domain="n/a",
+    ai_field="n/a",
+    intended_solution="n/a",
+    ai_maturity_level="n/a",
+    technical_expertise="n/a",
+    company_type="n/a",
+    target_market=["n/a"],
+    data_requirements=["n/a"],
+    fair_services_sought=["n/a"],
+    recommendations="n/a"
+)
+
+# Version of the extraction schema, so cached results are discarded when the agent or the models change
+SCHEMA_VERSION = hashlib.sha256(
+    EXTRACTION_AGENT_NAME.encode() + orjson.dumps(company_info_schema(), option=orjson.OPT_SORT_KEYS)
+).hexdigest()[:8]
+
 # Function to create or get extraction agent
 def setup_extraction_agent():
     """Set up the LlamaExtract agent with the CompanyInfo schema"""
+    existing_agent = None
     try:
         # Try to get existing agent
         existing_agents = llama_extract.list_agents()
         for agent in existing_agents:
-            if agent.name == "company-info-extractor":
-                print("Using existing extraction agent...")
-                return agent
+            if agent.name == EXTRACTION_AGENT_NAME:
+                existing_agent = agent
+                break
     except Exception as e:
-        print(f"Error checking existing agents: {e}")
+        logger.error("Error checking existing agents: %s", e)
         pass
     
-    print("Creating new extraction agent...")
+    if existing_agent is not None:
+        logger.info("Using existing extraction agent...")
+        try:
+            # An agent created before a change of the models still prompts with the old schema.
+            # Setting the schema validates it on the server, so the stored schema can be
+            # compared with the current one in the same normalized form.
+            stored_schema = existing_agent.data_schema
+            existing_agent.data_schema = company_info_schema()
+            if existing_agent.data_schema != stored_schema:
+                logger.info("Updating the schema of the extraction agent...")
+                existing_agent.save()
+        except Exception as e:
+            # The agent exists, so keep using it rather than creating another one with the same name
+            logger.error("Error updating the schema of the extraction agent: %s", e)
+        return existing_agent
+    
+    logger.info("Creating new extraction agent...")
     agent = llama_extract.create_agent(
-        name="company-info-extractor",
-        data_schema=CompanyInfo
+        name=EXTRACTION_AGENT_NAME,
+        data_schema=company_info_schema()
     )
     return agent
 
+# Function to convert a docx document to plain text
+def docx_to_text(file_path):
+    """Return the text of the paragraphs and tables of a docx document, in document order"""
+    document = Document(file_path)
+    lines = []
+    for block in document.iter_inner_content():
+        if isinstance(block, Table):
+            for row in block.rows:
+                lines.append(" | ".join(cell.text for cell in row.cells))
+        else:
+            lines.append(block.text)
+    return "\n".join(lines)
+
+# Function to get the plain text of a document
+def load_document_text(file_path):
+    """Return the plain text of a document, or None if it can't be converted locally.
+    The text is cached in a .txt folder next to the documents, together with the modification time
+    and size of the document, and reused while both match exactly."""
+    text_folder = os.path.join(os.path.dirname(file_path), '.txt')
+    text_file = os.path.join(text_folder, os.path.splitext(os.path.basename(file_path))[0] + '.json')
+    
+    # Compare exactly, since a document replaced by a copy with an older time (cp -p, unzip, rsync -t)
+    # must be converted again
+    stat = os.stat(file_path)
+    if os.path.exists(text_file):
+        try:
+            with open(text_file, 'rb') as f:
+                cached = orjson.loads(f.read())
+            if cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                return cached["text"]
+        except (OSError, orjson.JSONDecodeError, KeyError, AttributeError):
+            pass
+    
+    try:
+        text = docx_to_text(file_path)
+    except Exception as e:
+        logger.error("  Error converting %s to text: %s", os.path.basename(file_path), e)
+        return None
+    
+    os.makedirs(text_folder, exist_ok=True)
+    with open(text_file, 'wb') as f:
+        f.write(orjson.dumps({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "text": text}))
+    return text
+
+# Function to prepare a document for submission to LlamaExtract
+def document_source(file_path):
+    """Submit the plain text of a document instead of the docx file, which is much smaller to upload"""
+    text = load_document_text(file_path)
+    if text is None:
+        # Let LlamaExtract parse the document itself
+        return file_path
+    
+    company_name = os.path.splitext(os.path.basename(file_path))[0]
+    return SourceText(text_content=text, filename=f"{company_name}.txt")
+
+# Function to compute the cache key of a document
+def extraction_cache_key(file_path):
+    """Key a document on its text and the version of the extraction schema.
+    Keying on the text means edits that don't change the text (formatting, revisions) still hit the cache."""
+    text = load_document_text(file_path)
+    if text is not None:
+        content = text.encode('utf-8')
+    else:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+    return f"{hashlib.sha256(content).hexdigest()}_{SCHEMA_VERSION}"
+
+# Function to load the previously extracted information of a document
+def load_cached_company_info(file_path, cache_key):
+    """Return the cached CompanyInfo object of a document, or None if it has to be extracted"""
+    cached_json = extraction_cache.get(cache_key)
+    if cached_json is None:
+        return None
+    
+    try:
+        # The entry was valid when it was cached, and the key changes with the models, so it isn't revalidated
+        company_info = CompanyInfo.fast_from_trusted(orjson.loads(cached_json))
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        # A damaged or incomplete entry is treated as a miss, so the document is extracted again
+        return None
+    
+    # Entries are shared by documents with the same text, so a name taken from the file name isn't cached
+    if not company_info.company_name:
+        company_name = os.path.splitext(os.path.basename(file_path))[0]
+        company_info = company_info.model_copy(update={"company_name": company_name})
+    return company_info
+
+# Function to store the extracted information of a document
+def cache_company_info(cache_key, company_info):
+    """Cache the CompanyInfo object so the document isn't extracted again while it's unchanged"""
+    try:
+        extraction_cache.put(cache_key, company_info.model_dump_json())
+    except OSError as e:
+        logger.error("  Error caching the extracted information: %s", e)
+
+# Function to decide whether a failed LlamaExtract request should be retried
+def is_transient_error(exception):
+    """Return True for rate limiting, server errors and network failures"""
+    if isinstance(exception, ApiError):
+        return exception.status_code in TRANSIENT_STATUS_CODES
+    if isinstance(exception, httpx.HTTPStatusError):
+        return exception.response.status_code in TRANSIENT_STATUS_CODES
+    # The SDK reports httpx timeouts and network errors as the builtin exceptions
+    return isinstance(exception, (TimeoutError, ConnectionError, httpx.TransportError))
+
+# Retry transient failures with exponential backoff
+retry_transient_errors = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=30),
+    retry=retry_if_exception(is_transient_error),
+    reraise=True
+)
+
+# Function to queue a document with LlamaExtract
+@retry_transient_errors
+async def queue_extraction_job(agent, source, semaphore):
+    """Upload a document and queue its extraction job, retrying transient failures of this document only"""
+    # Only the upload and queueing are limited, so the queued jobs run on LlamaExtract at the same time
+    async with semaphore:
+        return await agent.queue_extraction(source)
+
+# Function to run an extraction with LlamaExtract from the event loop
+async def run_extraction_async(agent, source, semaphore):
+    """Queue a document as its own extraction job and wait for its result"""
+    job = await queue_extraction_job(agent, source, semaphore)
+    # The SDK polls the job until it finishes and retries its own status requests,
+    # so waiting isn't retried here, which would upload and extract the document again
+    return await agent._wait_for_job_result(job.id)
+
+# Function to keep the raw data of an extraction that couldn't be converted
+def save_failed_extraction(file_path, extracted_data, error):
+    """Write the raw extracted data and the error to the errors folder, so failures can be audited"""
+    company_name = os.path.splitext(os.path.basename(file_path))[0]
+    try:
+        os.makedirs(ERRORS_DIR, exist_ok=True)
+        with open(os.path.join(ERRORS_DIR, f"{company_name}.json"), 'wb') as f:
+            f.write(orjson.dumps({"error": str(error), "data": extracted_data}, option=orjson.OPT_INDENT_2, default=str))
+    except OSError as e:
+        logger.error("  Error saving the failed extraction: %s", e)
+
 # Function to extract company information using LlamaExtract
-def extract_company_info_llama(file_path):
+async def extract_company_info_llama(file_path, cache_key, agent, semaphore):
     """Extract company information using LlamaExtract"""
     file_name = os.path.basename(file_path)
-    company_name = os.path.splitext(file_name)[0]
+    
+    # Reuse the cached information if the document hasn't changed
+    company_info = load_cached_company_info(file_path, cache_key)
+    if company_info is not None:
+        logger.info("  Using cached information for %s...", file_name)
+        return company_info
     
     try:
-        print(f"  Analyzing document with LlamaExtract...")
+        logger.info("  Analyzing %s with LlamaExtract...", file_name)
         start_time = time.time()
         
-        # Get the extraction agent
-        agent = setup_extraction_agent()
-        
         # Extract information from the document
-        extraction_result = agent.extract(file_path)
+        extraction_result = await run_extraction_async(agent, document_source(file_path), semaphore)
         
         elapsed_time = time.time() - start_time
-        print(f"  LlamaExtract analysis completed in {elapsed_time:.2f} seconds")
+        logger.info("  LlamaExtract analysis of %s completed in %.2f seconds", file_name, elapsed_time)
+    
+    except Exception as e:
+        logger.error("  Error extracting information from %s with LlamaExtract: %s", file_name, e)
+        logger.info("  Falling back to default values...")
+        return default_company_info(os.path.splitext(file_name)[0])
+    
+    return build_company_info(extraction_result, file_path, cache_key)
+
+# Function to extract documents one by one, concurrently
+async def extract_documents_llama(file_paths, cache_keys, agent, results_out):
+    """Extract the documents concurrently on a single event loop and write each result as it completes"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+    
+    async def extract(file_path):
+        try:
+            return file_path, await extract_company_info_llama(file_path, cache_keys[file_path], agent, semaphore)
+        except Exception as e:
+            # Don't let a single failed document abort the whole batch
+            logger.error("  Error processing %s: %s", os.path.basename(file_path), e)
+            return file_path, None
+    
+    # Report progress as the documents complete
+    total_files = len(file_paths)
+    for i, task in enumerate(asyncio.as_completed([extract(file_path) for file_path in file_paths]), 1):
+        file_path, company_info = await task
+        logger.info("\nProcessed document %d/%d: %s", i, total_files, os.path.basename(file_path))
         
+        if company_info is not None:
+            write_result(results_out, file_path, cache_keys[file_path], company_info)
+            log_company_info(company_info)
+
+# Function to convert a LlamaExtract result into a CompanyInfo object
+def build_company_info(extraction_result, file_path, cache_key):
+    """Build a CompanyInfo object from the data of an extraction result"""
+    file_name = os.path.basename(file_path)
+    company_name = os.path.splitext(file_name)[0]
+    
+    extracted_data = None
+    name_from_file = False
+    try:
         # Get the extracted data
-        if extraction_result and hasattr(extraction_result, 'data'):
+        if extraction_result and getattr(extraction_result, 'data', None):
             extracted_data = extraction_result.data
             
             # Convert the extracted data to CompanyInfo object if it's a dict
             if isinstance(extracted_data, dict):
+                extracted_name = extracted_data.get('company_name')
+                name_from_file = not extracted_name or not extracted_name.strip()
+                
                 # Clean and validate the extracted data
                 cleaned_data = clean_extracted_data(extracted_data, company_name)
                 
                 # Create CompanyInfo object from the cleaned data
-                company_info = CompanyInfo(**cleaned_data)
-                return company_info
+                company_info = COMPANY_INFO_ADAPTER.validate_python(cleaned_data)
             else:
-                # If it's already a CompanyInfo object
-                if not extracted_data.company_name or extracted_data.company_name.strip() == "":
-                    extracted_data.company_name = company_name
-                return extracted_data
+                # If it's already a CompanyInfo object, which is frozen, so copy it to set the name
+                name_from_file = not extracted_data.company_name or extracted_data.company_name.strip() == ""
+                if name_from_file:
+                    extracted_data = extracted_data.model_copy(update={"company_name": company_name})
+                company_info = extracted_data
         else:
             raise Exception("No data extracted from document")
     
     except Exception as e:
-        print(f"  Error extracting information with LlamaExtract: {e}")
-        print(f"  Falling back to default values...")
-        
-        # Return a default object with minimal information
-        return CompanyInfo(
-            company_name="n/a",
-            country="n/a",
-            consultation_date="n/a",
-            experts="Unknown",
-            consultation_type="n/a",  # Use enum value
-            domain_info="n/a",
-            ai_field_info="n/a",
-            intended_solution="n/a",
-            ai_maturity_level="n/a",
-            technical_expertise="n/a",
-            company_type="n/a",
-            target_market="n/a",
-            data_requirements="n/a",
-            fair_services_sought="n/a",  # Use list
-            recommendations="n/a"
-        )
+        logger.error("  Error extracting information from %s with LlamaExtract: %s", file_name, e)
+        if isinstance(e, ValidationError):
+            save_failed_extraction(file_path, extracted_data, e)
+        logger.info("  Falling back to default values...")
+        return default_company_info(company_name)
+    
+    # Cache the name taken from the file name as empty, so each document sharing the entry gets its own
+    cache_company_info(cache_key, company_info.model_copy(update={"company_name": ""}) if name_from_file else company_info)
+    return company_info
+
+# Function to create the fallback CompanyInfo object
+def default_company_info(company_name):
+    """Return a default object with minimal information for a document that couldn't be extracted"""
+    return DEFAULT_COMPANY_INFO.model_copy(update={"company_name": company_name})
+
+# Function to recognize the fallback CompanyInfo object
+def is_default_company_info(company_info):
+    """Return True for a fallback object, whose placeholders can't come from a validated extraction"""
+    return company_info.domain == DEFAULT_COMPANY_INFO.domain
+
+# List fields of the extracted data
+_LIST_FIELDS = ["fair_services_sought", "target_market", "data_requirements"]
 
 def clean_extracted_data(extracted_data, fallback_company_name):
     """Clean and validate extracted data with special handling for list fields"""
     cleaned = extracted_data.copy()
     
     # Ensure company name is set
-    if not cleaned.get('company_name') or cleaned.get('company_name', '').strip() == "":
+    company_name = cleaned.get('company_name')
+    if not company_name or not company_name.strip():
         cleaned['company_name'] = fallback_company_name
     
     # Ensure consultation_date and country are strings, not None
@@ -134,118 +374,224 @@ def clean_extracted_data(extracted_data, fallback_company_name):
     if cleaned.get('country') is None:
         cleaned['country'] = "n/a"
     
-    # Handle services field - ensure it's in the right format
-    if 'fair_services_sought' in cleaned and isinstance(cleaned['fair_services_sought'], dict):
-        services_data = cleaned['fair_services_sought']
-        if 'services' in services_data:
-            services = services_data['services']
-            if isinstance(services, str):
-                services_data['services'] = [services]
-            elif not isinstance(services, list):
-                services_data['services'] = [str(services)]
-    
-    # Handle target_market field - ensure it's in the right format
-    if 'target_market' in cleaned and isinstance(cleaned['target_market'], dict):
-        target_data = cleaned['target_market']
-        if 'target_group' in target_data:
-            target_group = target_data['target_group']
-            if isinstance(target_group, str):
-                target_data['target_group'] = [target_group]
-            elif not isinstance(target_group, list):
-                target_data['target_group'] = [str(target_group)]
-    
-    # Handle data_requirements field - ensure it's in the right format
-    if 'data_requirements' in cleaned and isinstance(cleaned['data_requirements'], dict):
-        data_req = cleaned['data_requirements']
-        if 'data_type' in data_req:
-            data_type = data_req['data_type']
-            if isinstance(data_type, str):
-                data_req['data_type'] = [data_type]
-            elif not isinstance(data_type, list):
-                data_req['data_type'] = [str(data_type)]
+    # Ensure the list fields are lists
+    for field in _LIST_FIELDS:
+        value = cleaned.get(field)
+        if value is not None and not isinstance(value, list):
+            cleaned[field] = [str(value)]
     
     return cleaned
 
+# Function to log the extracted information of a document
+def log_company_info(company_info):
+    # Skip building the summary when it wouldn't be shown
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    target_market = "; ".join(company_info.target_market)
+    data_requirements = "; ".join(company_info.data_requirements)
+    services = "; ".join(company_info.fair_services_sought)
+    experts = ", ".join(company_info.experts)
+    
+    # Log the whole summary as a single record
+    logger.info(
+        f"  Results:\n"
+        f"    Company: {company_info.company_name}\n"
+        f"    Country: {company_info.country}\n"
+        f"    Consultation Date: {company_info.consultation_date}\n"
+        f"    Experts: {experts}\n"
+        f"    Consultation Type: {company_info.consultation_type}\n"
+        f"    Domain: {company_info.domain}\n"
+        f"    AI Field: {company_info.ai_field}\n"
+        f"    Intended Solution: {company_info.intended_solution}\n"
+        f"    AI Maturity Level: {company_info.ai_maturity_level}\n"
+        f"    Technical Expertise: {company_info.technical_expertise}\n"
+        f"    Company Type: {company_info.company_type}\n"
+        f"    Target Market: {target_market}\n"
+        f"    Data Requirements: {data_requirements}\n"
+        f"    FAIR Services Sought: {services}\n"
+        f"    Recommendations: {company_info.recommendations}"
+    )
+
+# Function to read the documents already written to the results file
+def load_processed_documents(results_file):
+    """Return the (file name, cache key) pairs of the documents extracted into the results file"""
+    if not os.path.exists(results_file):
+        return set()
+    
+    # Only the latest record of each document counts, the same record the Excel report shows
+    latest = {}
+    with open(results_file, 'rb') as f:
+        for line in f:
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Skip a line left incomplete by an interrupted run
+                continue
+            latest[record.get("source_file")] = record
+    
+    # Documents that fell back to the default values are extracted again
+    return {
+        (file_name, record.get("source_key"))
+        for file_name, record in latest.items()
+        if not record.get("fallback")
+    }
+
+# Function to append the extracted information of a document to the results file
+def write_result(results_out, file_path, cache_key, company_info):
+    """Write one JSON line per document and flush it, so finished documents survive a crash"""
+    record = {
+        "source_file": os.path.basename(file_path),
+        "source_key": cache_key,
+        "fallback": is_default_company_info(company_info),
+        # The placeholders of the fallback object aren't allowed values, so don't warn about them
+        **company_info.model_dump(mode='json', warnings=False)
+    }
+    results_out.write(orjson.dumps(record) + b"\n")
+    results_out.flush()
+
 # Function to process all documents in a folder
-def process_documents(folder_path):
+def process_documents(folder_path, results_file):
     # Get all files in the folder
-    docx_files = glob.glob(os.path.join(folder_path, '*.docx')) #replace (or add) with the file extension(s) of your choice
+    with os.scandir(folder_path) as entries:
+        docx_files = [
+            entry.path for entry in entries
+            if entry.name.endswith('.docx') and not entry.name.startswith('.') and entry.is_file() #replace (or add) with the file extension(s) of your choice
+        ]
     total_files = len(docx_files)
     
-    print(f"Found {total_files} documents to process")
+    logger.info("Found %d documents to process", total_files)
     
-    # Initialize a list to store the extracted information
-    results = []
+    # Compute the key of each document once, since it reads and hashes the document's text
+    cache_keys = {file_path: extraction_cache_key(file_path) for file_path in docx_files}
+    
+    # Documents already written by a previous run are skipped, so an interrupted run can be resumed
+    processed = load_processed_documents(results_file)
     
-    # Process each file with progress tracking
-    for i, file_path in enumerate(docx_files, 1):
-        file_name = os.path.basename(file_path)
-        print(f"\nProcessing document {i}/{total_files}: {file_name}")
+    with open(results_file, 'ab') as results_out:
+        pending_files = []
+        for file_path in docx_files:
+            file_name = os.path.basename(file_path)
+            if (file_name, cache_keys[file_path]) in processed:
+                logger.info("\nSkipping already processed document: %s", file_name)
+                continue
+            
+            # Reuse the cached information of documents that haven't changed since they were extracted
+            company_info = load_cached_company_info(file_path, cache_keys[file_path])
+            if company_info is not None:
+                logger.info("\nLoaded document from cache: %s", file_name)
+                write_result(results_out, file_path, cache_keys[file_path], company_info)
+                log_company_info(company_info)
+            else:
+                pending_files.append(file_path)
         
-        # Extract company info using LlamaExtract
-        company_info = extract_company_info_llama(file_path)
-        results.append(company_info)
+        # Documents with the same text share a cache key, so only one document per key is extracted
+        representatives = {}
+        duplicates = []
+        for file_path in pending_files:
+            key = cache_keys[file_path]
+            if key in representatives:
+                duplicates.append((file_path, representatives[key]))
+            else:
+                representatives[key] = file_path
+        pending_files = list(representatives.values())
+        
+        if pending_files:
+            # Get the extraction agent once for all remaining documents
+            agent = setup_extraction_agent()
+            
+            # Queue one extraction job per document, so a failed document falls back on its own
+            # while the results of the other documents are still used and cached
+            logger.info("  Queueing %d documents with LlamaExtract...", len(pending_files))
+            asyncio.run(extract_documents_llama(pending_files, cache_keys, agent, results_out))
         
-        print(f"  Results:")
-        print(f"    Company: {company_info.company_name}")
-        print(f"    Country: {company_info.country}")
-        print(f"    Consultation Date: {company_info.consultation_date}")
-        print(f"    Experts: {company_info.experts}")
-        print(f"    Consultation Type: {company_info.consultation_type.value}")
-        print(f"    Domain: {company_info.domain_info.domain.value}")
-        print(f"    AI Field: {company_info.ai_field_info.ai_field.value}")
-        print(f"    Intended Solution: {company_info.intended_solution}")
-        print(f"    AI Maturity Level: {company_info.ai_maturity_level.value}")
-        print(f"    Technical Expertise: {company_info.technical_expertise.value}")
-        print(f"    Company Type: {company_info.company_type.value}")
-        print(f"    Target Market: {'; '.join([tg.value for tg in company_info.target_market.target_group])}")
-        print(f"    Data Requirements: {'; '.join([dt.value for dt in company_info.data_requirements.data_type])}")
-        print(f"    FAIR Services Sought: {'; '.join([service.value for service in company_info.fair_services_sought.services])}")
-        print(f"    Recommendations: {company_info.recommendations}")
-    
-    print(f"\nAll {total_files} documents processed successfully!")
+        # The duplicates reuse the cached information of the document that was extracted
+        for file_path, original_path in duplicates:
+            file_name = os.path.basename(file_path)
+            original_name = os.path.basename(original_path)
+            logger.info("\nProcessed duplicate document: %s (same content as %s)", file_name, original_name)
+            
+            company_info = load_cached_company_info(file_path, cache_keys[file_path])
+            if company_info is None:
+                # The original document couldn't be extracted either
+                company_info = default_company_info(os.path.splitext(file_name)[0])
+            
+            write_result(results_out, file_path, cache_keys[file_path], company_info)
+            log_company_info(company_info)
+    
+    logger.info("\nAll %d documents processed successfully!", total_files)
+    
+    # Return the documents of this run in input order, so the matching results can be read back
+    return [os.path.basename(file_path) for file_path in docx_files]
+
+# Function to read the results of the given documents back from the results file
+def load_results(results_file, source_files):
+    """Return the CompanyInfoLite objects of the documents, in the given order"""
+    # Keep the latest record of each document, since a changed document is appended again
+    records = {}
+    with open(results_file, 'rb') as f:
+        for line in f:
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            records[record.get("source_file")] = record
+    
+    results = []
+    for file_name in source_files:
+        if file_name not in records:
+            continue
+        # The report only reads the records, so they are loaded without pydantic
+        results.append(CompanyInfoLite.from_record(records[file_name]))
     return results
 
 # Function to save results to Excel
-def save_to_excel(results, output_file):
-    print(f"\nSaving results to Excel file...")
-    
-    # Convert results to a pandas DataFrame
-    data = [
-        {
-            "Company Name": result.company_name,
-            "Country": result.country,
-            "Consultation Date": result.consultation_date,
-            "Experts": result.experts,
-            "Consultation Type": result.consultation_type.value,
-            "Domain": result.domain_info.domain.value,
-            "AI Field": result.ai_field_info.ai_field.value,
-            "Intended Solution": result.intended_solution,
-            "AI Maturity Level": result.ai_maturity_level.value,
-            "Technical Expertise": result.technical_expertise.value,
-            "Company Type": result.company_type.value,
-            "Target Market": "; ".join([tg.value for tg in result.target_market.target_group]),
-            "Data Requirements": "; ".join([dt.value for dt in result.data_requirements.data_type]),
-            "FAIR Services Sought": "; ".join([service.value for service in result.fair_services_sought.services]),
-            "Recommendations": result.recommendations
-        }
-        for result in results
-    ]
-    
-    df = pd.DataFrame(data)
+def save_to_excel(results_file, source_files, output_file):
+    logger.info("\nSaving results to Excel file...")
+    
+    results = load_results(results_file, source_files)
+    
+    # Convert results to a pandas DataFrame, building each column in a single pass
+    columns = {
+        "Company Name": [result.company_name for result in results],
+        "Country": [result.country for result in results],
+        "Consultation Date": [result.consultation_date for result in results],
+        "Experts": [", ".join(result.experts) for result in results],
+        "Consultation Type": [result.consultation_type for result in results],
+        "Domain": [result.domain for result in results],
+        "AI Field": [result.ai_field for result in results],
+        "Intended Solution": [result.intended_solution for result in results],
+        "AI Maturity Level": [result.ai_maturity_level for result in results],
+        "Technical Expertise": [result.technical_expertise for result in results],
+        "Company Type": [result.company_type for result in results],
+        "Target Market": ["; ".join(result.target_market) for result in results],
+        "Data Requirements": ["; ".join(result.data_requirements) for result in results],
+        "FAIR Services Sought": ["; ".join(result.fair_services_sought) for result in results],
+        "Recommendations": [result.recommendations for result in results]
+    }
+    
+    df = pd.DataFrame(columns)
     
     # Save to Excel
-    df.to_excel(output_file, index=False)
-    print(f"Results saved to {output_file}")
+    df.to_excel(output_file, index=False, engine="xlsxwriter")
+    logger.info("Results saved to %s", output_file)
     
     return df
 
 
 # Main function
 def main():
-    print("=" * 80)
-    print("AI CONSULTANCY DOCUMENT ANALYSIS")
-    print("=" * 80)
+    # Configure only this module's logger, so libraries such as httpx don't log every request
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    
+    logger.info("=" * 80)
+    logger.info("AI CONSULTANCY DOCUMENT ANALYSIS")
+    logger.info("=" * 80)
     
     import os
 
@@ -261,17 +607,20 @@ def main():
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
-    print("Analyzing documents...")
-    results = process_documents(input_folder)
+    # The extracted information is streamed to this file as the documents are processed
+    results_file = os.path.join(output_folder, 'results.jsonl')
+
+    logger.info("Analyzing documents...")
+    source_files = process_documents(input_folder, results_file)
     
     # Save the results to Excel
     output_file = os.path.join(output_folder, 'company_analysis_llama_extract.xlsx')
-    df = save_to_excel(results, output_file)
+    df = save_to_excel(results_file, source_files, output_file)
 
-    print("\n" + "=" * 80)
-    print(f"Analyzed {len(results)} documents")
-    print(f"Results saved to: {output_folder}")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    logger.info("Analyzed %d documents", len(df))
+    logger.info("Results saved to: %s", output_folder)
+    logger.info("=" * 80)
 
 if __name__ == "__main__":
     main()
@@ -1,49 +1,235 @@
 # models.py
-from pydantic import BaseModel, Field, field_validator
-from enum import Enum
-from typing import Optional, List
-
-# Define additional enumerations for new fields
-class ConsultationType(str, Enum):
-    REGULAR = "Regular"
-    POP_UP = "Pop-up"
-
-class MaturityLevel(str, Enum):
-    LOW = "Low"
-    MODERATE = "Moderate"
-    HIGH = "High"
-
-class CompanyType(str, Enum):
-    STARTUP = "Startup"
-    ESTABLISHED = "Established company"
-
-
-# Define the enumerations for domains and AI fields
-class Domain(str, Enum):
-    HEALTHCARE = "Healthcare & wellbeing"
-    AUTOMOTIVE = "Automotive"
-    CONSTRUCTION = "Construction"
-    MANUFACTURING = "Manufacturing"
-    CULTURAL = "Cultural & creative industries"
-    DEFENSE = "Defense"
-    EDUCATION = "Education & training"
-    ENVIRONMENT = "Environment & sustainability"
-    FINANCE = "Finance"
-    LEGAL = "Legal"
-    SECURITY = "Security"
-    SMART_CITIES = "Smart cities"
-    TRANSPORT = "Transport, mobility, logistics"
-    TRAVEL = "Travel & tourism"
-    BUSINESS = "Business development/business services"
-    REAL_ESTATE = "Real estate & property"
-    ARTS = "Arts & entertainment"
-    OTHER = "Other"
-
-
-
-# Define individual Pydantic models
-class CompanyDomain(BaseModel):
-    """Model for company domain classification"""
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from typing import Literal, List, Tuple
+from models_lite import CompanyInfoLite
+
+# Define additional value sets for new fields
+ConsultationType = Literal[
+    "Regular",
+    "Pop-up",
+]
+
+MaturityLevel = Literal[
+    "Low",
+    "Moderate",
+    "High",
+]
+
+CompanyType = Literal[
+    "Startup",
+    "Established company",
+]
+
+
+# Define the value sets for domains and AI fields
+Domain = Literal[
+    "Healthcare & wellbeing",
+    "Automotive",
+    "Construction",
+    "Manufacturing",
+    "Cultural & creative industries",
+    "Defense",
+    "Education & training",
+    "Environment & sustainability",
+    "Finance",
+    "Legal",
+    "Security",
+    "Smart cities",
+    "Transport, mobility, logistics",
+    "Travel & tourism",
+    "Business development/business services",
+    "Real estate & property",
+    "Arts & entertainment",
+    "Other",
+]
+
+AIField = Literal[
+    "Generative AI",
+    "Machine learning",
+    "Predictive analytics",
+    "Computer vision & image processing",
+    "Rule-based systems",
+    "Other",
+]
+
+Services = Literal[
+    "Technical advice",
+    "PoC development",
+    "Data analysis",
+    "AI roadmap design",
+    "Funding application support",
+    "Student thesis project",
+    "Networking support",
+    "R&D collaboration",
+    "Data collection",
+    "Use case design",
+    "Technical review",
+]
+
+# Comprehensive yet streamlined target groups for AI usage.
+# Merged from multiple sources and deduplicated for practical use.
+TargetGroup = Literal[
+    # Healthcare & Medical
+    "Healthcare professionals",
+    "Patients and healthcare consumers",
+    "Medical researchers",
+    "Pharmaceutical companies",
+    "Dental professionals",
+    "Psychologists, psychiatrists, and psychotherapists",
+    "Elderly care homes and assisted living providers",
+    "Functional medicine clinics and specialized healthcare providers",
+
+    # Business & Enterprise
+    "Small and medium businesses",
+    "Large enterprise companies and corporations",
+    "Startups and entrepreneurs",
+    "Business analysts, consultants, and advisors",
+
+    # Technology & Development
+    "Software developers and tech companies",
+    "AI/ML researchers and data scientists",
+    "IT professionals and system administrators",
+
+    # Education & Training
+    "School students",
+    "College/University students",
+    "Teachers & educational professionals",
+    "Educational institutions & schools",
+    "Online learning platforms",
+    "Organizations providing employee training and workforce education",
+    "Job seekers",
+
+    # Government & Public Sector
+    "Government agencies and public sector organizations",
+    "Municipalities and city governments",
+    "Defense forces and military organizations",
+    "Law enforcement & security",
+    "Emergency services",
+
+    # Finance & Legal
+    "Banks & financial institutions",
+    "Insurance companies",
+    "FinTech companies & payment processors",
+    "Law firms & legal professionals",
+
+    # Construction & Real Estate
+    "Construction companies, contractors, and related sectors",
+    "Architects, engineers, and building designers",
+    "Real estate agents, property managers, and investors",
+    "Property owners, landlords, and facility managers",
+
+    # Manufacturing & Industry
+    "Manufacturing companies and industrial producers",
+    "Automotive manufacturers and car dealerships",
+    "Machine parts vendors and equipment suppliers",
+
+    # Logistics & Transportation
+    "Logistics companies and transportation operators",
+
+    # Retail & E-commerce
+    "Retail companies and e-commerce platforms",
+    "Food brands, producers, and farmers",
+    "Customer service and support teams",
+
+    # Creative & Media
+    "Content creators and digital artists",
+    "Media companies, streaming services, and entertainment industry",
+    "Music schools, teachers, and music professionals",
+    "Advertising agencies and marketing firms",
+
+    # Hospitality & Events
+    "Hospitality industry, venues, and event management",
+    "Travel agencies and tourism providers",
+    "Shopping centers, sports arenas, and entertainment venues",
+
+    # Energy & Environment
+    "Energy companies and utility providers",
+    "Environmental and sustainability organizations",
+    "Organizations needing CSRD/ESRS compliance",
+
+    # Research & Development
+    "Research institutions, think tanks, and inventors",
+    "Pharmaceutical and biotech companies",
+    "Organizations seeking EU funding and grants",
+
+    # Agriculture & Food
+    "Agriculture, food industry, and farmers",
+
+    # Specialized Services
+    "Immigration authorities, migrants, and employers",
+    "Recruiters, HR departments, and employment services",
+    "Fitness trainers and wellness coaches",
+
+    # General Users
+    "General consumers and public users",
+    "Senior executives and C-level leaders",
+    "Knowledge workers and professionals",
+
+    #Sports
+    "Sport professionals",
+    "Gaming companies, game programmers",
+
+    # Other
+    "Other target groups not specified above",
+]
+
+
+# High-level data type categories for AI solutions.
+# Simplified classification focusing on major data formats and domains.
+DataType = Literal[
+    "Text data",
+    "Image data",
+    "Video data",
+    "Audio and speech data",
+    "Tabular and structured data",
+    "Electronic health records and medical data",
+    "Geospatial and location data",
+    "Sensor signals and IoT data",
+    "Financial and business data",
+    "Genomics and biological data",
+    "Engineering drawings and technical data",
+    "Other data types",
+]
+
+
+def _as_list(v):
+    """Return the value of a list field as a list, wrapping a string or single value"""
+    # The LLM usually returns a list already, so check for it first. The exact type checks
+    # are cheaper than isinstance, and JSON values are never subclasses of list or str.
+    value_type = type(v)
+    if value_type is list:
+        return v
+    elif value_type is str:
+        return [v]
+    else:
+        return [v] if v else []
+
+
+# Main CompanyInfo model
+class CompanyInfo(BaseModel):
+    """Main model for company information extraction"""
+    # Extra keys of the LLM output are dropped, and an extracted object isn't modified afterwards
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
+    company_name: str = Field(..., description="The name of the company")
+    
+    country: str = Field(..., description="Country where the company is located or headquartered")
+    
+    consultation_date: str = Field(
+        ..., 
+        description="Date of the consultation or report in dd-mm-yyyy format (e.g., 15-03-2024). "
+    )
+    
+    experts: Tuple[str, ...] = Field(
+        ..., 
+        description="Names of the persons providing AI consultancy, one name per item."
+    )
+    
+    consultation_type: ConsultationType = Field(
+        ..., 
+        description="Type of consultation - either 'Regular' or 'Pop-up'. This must be explicitly mentioned in the document."
+    )
+    
     domain: Domain = Field(
         ..., 
         description="""The primary industry domain the company belongs to. Choose ONE from:
@@ -66,17 +252,7 @@ class CompanyDomain(BaseModel):
         - Arts & entertainment: Entertainment, media, gaming, arts, leisure sectors
         - Other: Companies that don't clearly fit into any of the above categories"""
     )
-
-class AIField(str, Enum):
-    GENERATIVE_AI = "Generative AI"
-    MACHINE_LEARNING = "Machine learning"
-    PREDICTIVE_ANALYTICS = "Predictive analytics"
-    COMPUTER_VISION = "Computer vision & image processing"
-    RULE_BASED = "Rule-based systems"
-    OTHER = "Other"
-
-class CompanyAIField(BaseModel):
-    """Model for AI field classification"""
+    
     ai_field: AIField = Field(
         ..., 
         description="""The primary AI field the company is using or planning to use. Choose ONE from:
@@ -87,172 +263,28 @@ class CompanyAIField(BaseModel):
         - Rule-based systems: Predefined rules, logic, knowledge bases, expert systems, decision trees, rule-based reasoning
         - Other: AI field that doesn't clearly fit into any of the above categories"""
     )
-
-class Services(str, Enum):
-    TECHNICAL_ADVICE = "Technical advice"
-    PoC_DEV = "PoC development"
-    DATA_ANALYSIS = "Data analysis"
-    AI_ROADMAP = "AI roadmap design"
-    FUNDING_SUPPORT = "Funding application support"
-    THESIS_SUPPORT = "Student thesis project"
-    COLLABORATION = "Networking support"
-    RnD_SUPPORT = "R&D collaboration"
-    DATA_COLLECTION = "Data collection"
-    USE_CASE_DESIGN = "Use case design"
-    TECHNICAL_REVIEW = "Technical review"
-
-class ServicesDescriptions(BaseModel):
-    """Model for selecting FAIR services - allows multiple services"""
-    services: List[Services] = Field(
-        ...,
-        description = """The services sought by the company. Choose one or more relevant services from:
-        - Technical advice: Services related to algorithmic design, model selection, training, testing, deployment, or other technical aspects
-        - PoC development: Support in developing proof of concept
-        - Data analysis: Support in analyzing data and getting insights from it. 
-        - AI roadmap design: Support in designing a concrete AI strategy or roadmap
-        - Funding application support: Support in applying for funding 
-        - Student thesis project: Developing a prototype or proof of concept through a student thesis project (master thesis).
-        - Networking support: Connecting with other companies for collaboration
-        - R&D collaboration: Partenering in R&D and co-research or co-development projects
-        - Data collection: Support in collecting data for training AI models
-        - Use case design: Support in understanding AI integration and use case design. Required by companies which do not know which use-case is suitable for their business needs. 
-        - Technical review: Technical review of the existing AI solution or product
-        - Other: Services required by the company that don't clearly fit into any of the above categories
-
-        
-        Return as a list of services, for example: ["Technical advice", "PoC development"] or ["AI roadmap design"]
-        """
-    )
-    
-    @field_validator('services', mode='before')
-    @classmethod
-    def validate_services(cls, v):
-        """Convert string or single service to list"""
-        if isinstance(v, str):
-            # If it's a string, convert to list
-            return [v]
-        elif isinstance(v, Services):
-            # If it's a single Services enum, convert to list
-            return [v]
-        elif isinstance(v, list):
-            # If it's already a list, return as is
-            return v
-        else:
-            # Fallback
-            return [v] if v else []
-
-class TargetGroup(str, Enum):
-    """
-    Comprehensive yet streamlined target groups for AI usage.
-    Merged from multiple sources and deduplicated for practical use.
-    """
-    
-    # Healthcare & Medical
-    HEALTHCARE_PROFESSIONALS = "Healthcare professionals"
-    PATIENTS_CONSUMERS = "Patients and healthcare consumers"
-    MEDICAL_RESEARCHERS = "Medical researchers"
-    PHARMACEUTICAL = "Pharmaceutical companies"
-    DENTAL_PROFESSIONALS = "Dental professionals"
-    MENTAL_HEALTH_PROVIDERS = "Psychologists, psychiatrists, and psychotherapists"
-    ELDERLY_CARE_PROVIDERS = "Elderly care homes and assisted living providers"
-    SPECIALIZED_MEDICAL = "Functional medicine clinics and specialized healthcare providers"
-    
-    # Business & Enterprise
-    SMALL_MEDIUM_BUSINESSES = "Small and medium businesses"
-    LARGE_ENTERPRISES = "Large enterprise companies and corporations"
-    STARTUPS_ENTREPRENEURS = "Startups and entrepreneurs"
-    BUSINESS_PROFESSIONALS = "Business analysts, consultants, and advisors"
-    
-    # Technology & Development
-    SOFTWARE_DEVELOPERS = "Software developers and tech companies"
-    AI_ML_RESEARCHERS = "AI/ML researchers and data scientists"
-    IT_PROFESSIONALS = "IT professionals and system administrators"
-    
-    # Education & Training
-    STUDENTS_PRIMARY = "School students"
-    STUDENTS_HIGHER = "College/University students"
-    TEACHERS_EDUCATORS = "Teachers & educational professionals"
-    EDUCATIONAL_INSTITUTIONS = "Educational institutions & schools"
-    ONLINE_LEARNING = "Online learning platforms"
-    TRAINING_ORGANIZATIONS = "Organizations providing employee training and workforce education"
-    JOB_SEEKERS = "Job seekers"
-    
-    # Government & Public Sector
-    GOVERNMENT_AGENCIES = "Government agencies and public sector organizations"
-    MUNICIPALITIES = "Municipalities and city governments"
-    DEFENSE_FORCES = "Defense forces and military organizations"
-    PUBLIC_SAFETY = "Law enforcement & security"
-    EMERGENCY = "Emergency services"
-    
-    # Finance & Legal
-    FINANCIAL_INSTITUTIONS = "Banks & financial institutions"
-    INSURANCE = "Insurance companies"
-    FINTECH_COMPANIES = "FinTech companies & payment processors"
-    LEGAL_PROFESSIONALS = "Law firms & legal professionals"
-    
-    # Construction & Real Estate
-    CONSTRUCTION_COMPANIES = "Construction companies, contractors, and related sectors"
-    ARCHITECTS_ENGINEERS = "Architects, engineers, and building designers"
-    REAL_ESTATE_PROFESSIONALS = "Real estate agents, property managers, and investors"
-    PROPERTY_OWNERS = "Property owners, landlords, and facility managers"
-    
-    # Manufacturing & Industry
-    MANUFACTURING_COMPANIES = "Manufacturing companies and industrial producers"
-    AUTOMOTIVE_COMPANIES = "Automotive manufacturers and car dealerships"
-    MACHINE_PARTS_VENDORS = "Machine parts vendors and equipment suppliers"
-    
-    # Logistics & Transportation
-    LOGISTICS_COMPANIES = "Logistics companies and transportation operators"
-    
-    # Retail & E-commerce
-    RETAILERS_ECOMMERCE = "Retail companies and e-commerce platforms"
-    FOOD_BRANDS_PRODUCERS = "Food brands, producers, and farmers"
-    CUSTOMER_SERVICE = "Customer service and support teams"
-    
-    # Creative & Media
-    CONTENT_CREATORS = "Content creators and digital artists"
-    MEDIA_ENTERTAINMENT = "Media companies, streaming services, and entertainment industry"
-    MUSIC_INDUSTRY = "Music schools, teachers, and music professionals"
-    ADVERTISING_MARKETING = "Advertising agencies and marketing firms"
-    
-    # Hospitality & Events
-    HOSPITALITY_VENUES = "Hospitality industry, venues, and event management"
-    TRAVEL_TOURISM = "Travel agencies and tourism providers"
-    SHOPPING_ENTERTAINMENT = "Shopping centers, sports arenas, and entertainment venues"
-    
-    # Energy & Environment
-    ENERGY_UTILITIES = "Energy companies and utility providers"
-    ENVIRONMENTAL_ORGANIZATIONS = "Environmental and sustainability organizations"
-    COMPLIANCE_ORGANIZATIONS = "Organizations needing CSRD/ESRS compliance"
     
-    # Research & Development
-    RESEARCH_INSTITUTIONS = "Research institutions, think tanks, and inventors"
-    PHARMACEUTICAL_BIOTECH = "Pharmaceutical and biotech companies"
-    EU_FUNDING_SEEKERS = "Organizations seeking EU funding and grants"
-    
-    # Agriculture & Food
-    AGRICULTURE_FOOD = "Agriculture, food industry, and farmers"
+    intended_solution: str = Field(
+        ..., 
+        description="Brief description (one phrase not exceeding a few words) of the company's proposed or intended AI solution. Examples: 'AI-based healthcare app for lifestyle recommendations', 'AI-based language learning platform', 'Computer vision system for quality control', etc."
+    )
     
-    # Specialized Services
-    IMMIGRATION_SERVICES = "Immigration authorities, migrants, and employers"
-    RECRUITING_HR = "Recruiters, HR departments, and employment services"
-    FITNESS_WELLNESS = "Fitness trainers and wellness coaches"
+    ai_maturity_level: MaturityLevel = Field(
+        ..., 
+        description="Company's AI maturity level - Low, Moderate, or High. "
+    )
     
-    # General Users
-    GENERAL_CONSUMERS = "General consumers and public users"
-    SENIOR_EXECUTIVES = "Senior executives and C-level leaders"
-    KNOWLEDGE_WORKERS = "Knowledge workers and professionals"
+    technical_expertise: MaturityLevel = Field(
+        ..., 
+        description="Company's technical expertise and capability level - Low, Moderate, or High."
+    )
     
-    #Sports 
-    SPORTS = "Sport professionals"
-    GAMING = "Gaming companies, game programmers"
+    company_type: CompanyType = Field(
+        ..., 
+        description="Type of company - either 'Startup' or 'Established company'."
+    )
     
-    # Other
-    OTHER = "Other target groups not specified above"
-
-class CompanyTargetGroup(BaseModel):
-    """Model for company target group classification"""
-    target_group: List[TargetGroup] = Field(
+    target_market: List[TargetGroup] = Field(
         ..., 
         description="""The primary target group that would most benefit from the AI solution. Choose ONE from:
         - Healthcare professionals: Medical practitioners, clinical staff, healthcare facilities
@@ -326,41 +358,8 @@ class CompanyTargetGroup(BaseModel):
 
         """
     )
-    @field_validator('target_group', mode='before')
-    @classmethod
-    def validate_target_group(cls, v):
-        """Convert string or single target group to list"""
-        if isinstance(v, str):
-            return [v]
-        elif isinstance(v, TargetGroup):
-            return [v]
-        elif isinstance(v, list):
-            return v
-        else:
-            return [v] if v else []
-
-class DataType(str, Enum):
-    """
-    High-level data type categories for AI solutions.
-    Simplified classification focusing on major data formats and domains.
-    """
     
-    TEXT_DATA = "Text data"
-    IMAGE_DATA = "Image data"
-    VIDEO_DATA = "Video data"
-    AUDIO_DATA = "Audio and speech data"
-    TABULAR_DATA = "Tabular and structured data"
-    ELECTRONIC_HEALTH_RECORDS = "Electronic health records and medical data"
-    GEOSPATIAL_DATA = "Geospatial and location data"
-    SENSOR_DATA = "Sensor signals and IoT data"
-    FINANCIAL_DATA = "Financial and business data"
-    GENOMICS_DATA = "Genomics and biological data"
-    ENGINEERING_DATA = "Engineering drawings and technical data"
-    OTHER = "Other data types"
-
-class DataRequirements(BaseModel):
-    """Model for data requirements classification"""
-    data_type: List[DataType]  = Field(
+    data_requirements: List[DataType] = Field(
         ..., 
         description="""The primary type of data required for the AI solution. Choose one or more relevant data types from:
         - Text data: Text documents, reports, scientific papers, legal contracts, patient notes, therapy transcripts, regulatory documents, user comments, CVs, job descriptions, and any textual content
@@ -379,88 +378,87 @@ class DataRequirements(BaseModel):
         Return as a list of data types, for example: ["Text and document data", "Image and visual data"] or ["Audio and speech data"]
         """
     )
-    @field_validator('data_type', mode='before')
-    @classmethod
-    def validate_data_type(cls, v):
-        """Convert string or single data type to list"""
-        if isinstance(v, str):
-            return [v]
-        elif isinstance(v, DataType):
-            return [v]
-        elif isinstance(v, list):
-            return v
-        else:
-            return [v] if v else []
-
-
-# Main CompanyInfo model that integrates the individual models
-class CompanyInfo(BaseModel):
-    """Main model for company information extraction"""
-    company_name: str = Field(..., description="The name of the company")
-    
-    country: str = Field(..., description="Country where the company is located or headquartered")
     
-    consultation_date: str = Field(
-        ..., 
-        description="Date of the consultation or report in dd-mm-yyyy format (e.g., 15-03-2024). "
-    )
-    
-    experts: str = Field(
-        ..., 
-        description="Names of the persons providing AI consultancy. If multiple experts, separate them with commas."
-    )
-    
-    consultation_type: ConsultationType = Field(
-        ..., 
-        description="Type of consultation - either 'Regular' or 'Pop-up'. This must be explicitly mentioned in the document."
-    )
-    
-    domain_info: CompanyDomain = Field(
-        ..., 
-        description="Domain classification information for the company"
-    )
-    
-    ai_field_info: CompanyAIField = Field(
-        ..., 
-        description="AI field classification information for the company"
-    )
-    
-    intended_solution: str = Field(
-        ..., 
-        description="Brief description (one phrase not exceeding a few words) of the company's proposed or intended AI solution. Examples: 'AI-based healthcare app for lifestyle recommendations', 'AI-based language learning platform', 'Computer vision system for quality control', etc."
-    )
-    
-    ai_maturity_level: MaturityLevel = Field(
-        ..., 
-        description="Company's AI maturity level - Low, Moderate, or High. "
+    fair_services_sought: List[Services] = Field(
+        ...,
+        description = """The services sought by the company. Choose one or more relevant services from:
+        - Technical advice: Services related to algorithmic design, model selection, training, testing, deployment, or other technical aspects
+        - PoC development: Support in developing proof of concept
+        - Data analysis: Support in analyzing data and getting insights from it. 
+        - AI roadmap design: Support in designing a concrete AI strategy or roadmap
+        - Funding application support: Support in applying for funding 
+        - Student thesis project: Developing a prototype or proof of concept through a student thesis project (master thesis).
+        - Networking support: Connecting with other companies for collaboration
+        - R&D collaboration: Partenering in R&D and co-research or co-development projects
+        - Data collection: Support in collecting data for training AI models
+        - Use case design: Support in understanding AI integration and use case design. Required by companies which do not know which use-case is suitable for their business needs. 
+        - Technical review: Technical review of the existing AI solution or product
+        - Other: Services required by the company that don't clearly fit into any of the above categories
+
+        
+        Return as a list of services, for example: ["Technical advice", "PoC development"] or ["AI roadmap design"]
+        """
     )
     
-    technical_expertise: MaturityLevel = Field(
+    recommendations: str = Field(
         ..., 
-        description="Company's technical expertise and capability level - Low, Moderate, or High."
+        description="Very brief summary of key recommendations focusing on the most important suggested actions. If multiple points, separate them with semicolons. Keep it concise and actionable. Each action point should be a very brief phrase."
     )
     
-    company_type: CompanyType = Field(
-        ..., 
-        description="Type of company - either 'Startup' or 'Established company'."
-    )
+    @field_validator('target_market', 'data_requirements', 'fair_services_sought', mode='before')
+    @classmethod
+    def validate_list_fields(cls, v):
+        """Convert string or single value of a list field to list"""
+        return _as_list(v)
     
-    target_market: CompanyTargetGroup = Field(
-        ..., 
-        description="Identified target market or customers. Select one or more relevant target groups. If multiple points, separate them with semicolons."
-    )
+    @field_validator('experts', mode='before')
+    @classmethod
+    def validate_experts(cls, v):
+        """Split a comma-separated string of experts into a tuple of names"""
+        if isinstance(v, str):
+            return tuple(name.strip() for name in v.split(',') if name.strip())
+        return v
     
-    data_requirements: DataRequirements = Field(
-        ..., 
-        description="Type and format of data required for the intended AI integration. Select one or more relevant target groups. If multiple points, separate them with semicolons."
-    )
+    def to_lite(self):
+        """Return the information as a CompanyInfoLite"""
+        return CompanyInfoLite._make([getattr(self, field) for field in CompanyInfoLite._fields])
     
-    fair_services_sought: ServicesDescriptions = Field(
-        ..., 
-        description="Services expected by the company. Select one or more relevant services. If multiple points, separate them with semicolons."
-    )
+    @classmethod
+    def from_json_bytes(cls, raw):
+        """Parse and validate a CompanyInfo from JSON bytes in a single pass"""
+        # pydantic-core parses the JSON itself, so no intermediate dict is built
+        return COMPANY_INFO_ADAPTER.validate_json(raw)
     
-    recommendations: str = Field(
-        ..., 
-        description="Very brief summary of key recommendations focusing on the most important suggested actions. If multiple points, separate them with semicolons. Keep it concise and actionable. Each action point should be a very brief phrase."
-    )
\ No newline at end of file
+    @classmethod
+    def fast_from_trusted(cls, data):
+        """
+        Build a CompanyInfo from data that was already validated, without validating it again.
+        Use it for data written by this program, such as cache entries and result records;
+        raw LLM output must still go through COMPANY_INFO_ADAPTER.
+        """
+        # model_construct skips the field validators, so coerce the list and tuple fields here
+        return cls.model_construct(**{
+            **data,
+            'experts': tuple(data['experts']),
+            'target_market': _as_list(data['target_market']),
+            'data_requirements': _as_list(data['data_requirements']),
+            'fair_services_sought': _as_list(data['fair_services_sought']),
+        })
+
+
+# CompanyInfoLite copies the fields of CompanyInfo by hand, so fail at import time when they drift apart
+if CompanyInfoLite._fields != tuple(CompanyInfo.model_fields):
+    raise RuntimeError("CompanyInfoLite in models_lite.py must have the same fields, in the same order, as CompanyInfo")
+
+# Validator for CompanyInfo, built once at import time. Validate JSON with
+# COMPANY_INFO_ADAPTER.validate_json(raw_bytes) rather than parsing it first, so that
+# pydantic-core validates straight from the bytes without an intermediate dict.
+COMPANY_INFO_ADAPTER = TypeAdapter(CompanyInfo)
+
+# JSON schema of CompanyInfo, built once since the field descriptions make it large.
+# It is shared between callers, so it must not be modified.
+_CACHED_SCHEMA = CompanyInfo.model_json_schema()
+
+def company_info_schema():
+    """Return the JSON schema of CompanyInfo"""
+    return _CACHED_SCHEMA
@@ -0,0 +1,29 @@
+# models_lite.py
+from typing import NamedTuple, List, Tuple
+
+# Read-only view of the extracted information of a document, for code that only reads stored
+# results and shouldn't pay for importing and validating with pydantic. The fields are in the
+# same order as those of CompanyInfo in models.py.
+class CompanyInfoLite(NamedTuple):
+    """Lightweight company information, without validation"""
+    company_name: str
+    country: str
+    consultation_date: str
+    experts: Tuple[str, ...]
+    consultation_type: str
+    domain: str
+    ai_field: str
+    intended_solution: str
+    ai_maturity_level: str
+    technical_expertise: str
+    company_type: str
+    target_market: List[str]
+    data_requirements: List[str]
+    fair_services_sought: List[str]
+    recommendations: str
+    
+    @classmethod
+    def from_record(cls, record):
+        """Build a CompanyInfoLite from a stored record, ignoring the keys that aren't fields"""
+        # JSON stores the experts as a list, so convert them back like CompanyInfo does
+        return cls._make([record[field] for field in cls._fields])._replace(experts=tuple(record['experts']))